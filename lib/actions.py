@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from typing import List, Optional
 from dataclasses import dataclass
@@ -11,9 +12,10 @@ from optypes.op_types import (
     VaultOverview,
 )
 from util.item_processor import ItemProcessor
-from util.utils import chunk_list
+from util.utils import chunk_list, chunked_view, optimal_chunk_size
 from util.vault_perm_manager import VaultPermissionsManager
 
+from lib.base_handler import get_default_client
 from lib.items import ItemHandler, ItemOperationError
 from lib.users import UserHandler, UserOperationError
 from lib.vaults import VaultHandler
@@ -34,13 +36,16 @@ class PermissionError(ActionError):
 
 class Actions:
     def __init__(self, testing: bool = False) -> None:
-        self.vaults = VaultHandler()
-        self.users = UserHandler()
-        self.items = ItemHandler()
+        # One client shared across all handlers - they all talk to the
+        # same CLI and there's no per-handler state in the client.
+        client = get_default_client()
+        self.vaults = VaultHandler(client=client)
+        self.users = UserHandler(client=client)
+        self.items = ItemHandler(client=client)
         self.testing = testing
 
-        self.permissions_manager = VaultPermissionsManager()
-        self.item_processor = ItemProcessor()
+        self.permissions_manager = VaultPermissionsManager(client=client)
+        self.item_processor = ItemProcessor(client=client)
 
     async def ir_credential_search(
         self, search_term: str, vault_id: Optional[str] = None
@@ -79,11 +84,10 @@ class Actions:
         """
         try:
             vaults = await self.vaults.list(permissions=Permissions.ALLOW_VIEWING)
-            vault_chunks = chunk_list(vaults, 10)
-            logger.info(f"Processing {len(vault_chunks)} chunks of vaults")
+            logger.info(f"Processing {len(vaults)} vaults")
 
             await self.permissions_manager.update_permissions_for_vaults(
-                vault_chunks,
+                vaults,
                 group=GroupSet.OWNERS,
                 permission=Permissions.ALLOW_VIEWING,
                 action=PermissionOperator.REVOKE,
@@ -117,19 +121,30 @@ class Actions:
             else:
                 vaults = await self.vaults.list(permissions=joined_permissions)
 
-            for vault in vaults:
-                vault_user_list = await self.vaults.user.list(vault=vault.id)
-                filtered_users = await self._filter_users_by_permission(
-                    vault_user_list, permissions, action
-                )
+            # Each vault is independent subprocess-bound work, so fan out
+            # instead of paying the full list/filter/update cost serially.
+            semaphore = asyncio.Semaphore(8)
 
-                users_in_vault_chunks = chunk_list(filtered_users, 100)
-                await self.permissions_manager.update_permissions_for_user(
-                    users_in_vault_chunks,
-                    permissions=joined_permissions,
-                    action=action,
-                    vault_id=vault.id,
-                )
+            async def process_vault(vault: VaultOverview) -> None:
+                async with semaphore:
+                    vault_user_list = await self.vaults.user.list(vault=vault.id)
+                    filtered_users = await self._filter_users_by_permission(
+                        vault_user_list, permissions, action
+                    )
+
+                    # Lazy view: chunks are sliced out as the executor
+                    # consumes them, nothing is materialized up front
+                    users_in_vault_chunks = chunked_view(
+                        filtered_users, optimal_chunk_size("user_permissions", 100)
+                    )
+                    await self.permissions_manager.update_permissions_for_user(
+                        users_in_vault_chunks,
+                        permissions=joined_permissions,
+                        action=action,
+                        vault_id=vault.id,
+                    )
+
+            await asyncio.gather(*(process_vault(vault) for vault in vaults))
         except Exception as e:
             logger.error(f"Failed to update user permissions: {e}")
             raise
@@ -140,21 +155,26 @@ class Actions:
         permissions: List[str],
         action: PermissionOperator,
     ) -> List[UserDetails]:
-        """Filters the user list based on their current permissions."""
-        filtered_users = []
-        for vault_user in vault_user_list:
-            for permission in permissions:
-                if (
-                    action == PermissionOperator.REVOKE
-                    and permission in vault_user.permissions
-                ):
-                    filtered_users.append(vault_user)
-                elif (
-                    action == PermissionOperator.GRANT
-                    and permission not in vault_user.permissions
-                ):
-                    filtered_users.append(vault_user)
-        return filtered_users
+        """Filters the user list based on their current permissions.
+
+        Set membership replaces the old nested loop, which scanned each
+        user's permission list per requested permission and appended the
+        same user once per match.
+        """
+        perm_set = set(permissions)
+        if action == PermissionOperator.REVOKE:
+            # Only users that currently hold at least one of the permissions
+            return [
+                user
+                for user in vault_user_list
+                if perm_set & set(user.permissions)
+            ]
+        # GRANT: only users missing at least one of the permissions
+        return [
+            user
+            for user in vault_user_list
+            if not perm_set.issubset(user.permissions)
+        ]
 
     async def _handle_vault_search(
         self, search_term: str, vault_id: Optional[str] = None
@@ -177,17 +197,15 @@ class Actions:
                 else:
                     vaults = await self.vaults.list()
 
-            vault_chunks = chunk_list(vaults, 10)
-
             await self.permissions_manager.update_permissions_for_vaults(
-                vault_chunks,
+                vaults,
                 group=GroupSet.OWNERS,
                 permission=Permissions.ALLOW_VIEWING,
                 action=PermissionOperator.GRANT,
             )
 
             all_items = await self.items.list(vault_id)
-            item_chunks = chunk_list(all_items, 10)
+            item_chunks = chunk_list(all_items, optimal_chunk_size("item_search"))
 
             if self.testing:
                 item_chunks = [item_chunks[:1]]  # Process only the first chunk in testing
@@ -1,19 +1,104 @@
-from typing import List, Optional, Any, TypeVar, Generic
+import functools
+import logging
+import os
+import re
+import time
+from typing import Dict, List, Optional, Any, Tuple, TypeVar, Generic
 from lib.command_builder import CommandBuilder
-from lib.op import OpClient
+from lib.op import OpClient, OpNotFoundError
 
 T = TypeVar('T')
 
+logger = logging.getLogger(__name__)
+
+_NOT_FOUND_RE = re.compile(r"not found", re.IGNORECASE)
+
+
+def translate_errors(not_found_exc: type, operation_exc: type, entity: str):
+    """Translate raw CLI failures into a handler's typed exceptions
+
+    Every handler method was repeating the same
+    `except Exception: if "not found" in str(e).lower(): ...` block, each
+    with a fresh lowercased copy of the message. This wraps an async method
+    with a single precompiled check instead.
+
+    Args:
+        not_found_exc: Exception type for missing resources
+        operation_exc: Exception type for any other failure
+        entity: Resource name used in messages (e.g. "group")
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            try:
+                return await func(self, *args, **kwargs)
+            except (not_found_exc, operation_exc):
+                raise
+            except Exception as e:
+                ident = args[0] if args else ""
+                if isinstance(e, OpNotFoundError) or _NOT_FOUND_RE.search(str(e)):
+                    raise not_found_exc(f"{entity.capitalize()} {ident} not found")
+                logger.error(f"Failed to {func.__name__} {entity} {ident}: {e}")
+                raise operation_exc(
+                    f"Failed to {func.__name__} {entity} {ident}"
+                ) from e
+        return wrapper
+    return decorator
+
+# Subcommands that don't change server-side state and can be cached briefly
+_IDEMPOTENT_SUBCOMMANDS = frozenset({"list", "get"})
+
+# Within a single CLI workflow the same vault/user/item lookups repeat within
+# seconds; 1Password state rarely changes underneath us in that window.
+_CACHE_TTL_SECONDS = 30.0
+
+_default_client: Optional[OpClient] = None
+
+
+def get_default_client() -> OpClient:
+    """Return the shared OpClient, constructing it on first use.
+
+    Handlers all talk to the same CLI, so there's no reason for each one
+    to hold its own client instance.
+
+    Set OP_PERSISTENT_SESSION=1 to drive all handler commands through one
+    long-lived op process instead of forking per call; the client falls
+    back to per-call execution automatically if the CLI can't be held open.
+    """
+    global _default_client
+    if _default_client is None:
+        _default_client = OpClient(
+            persistent_session=os.environ.get("OP_PERSISTENT_SESSION") == "1"
+        )
+    return _default_client
+
+
+async def aclose_default_client() -> None:
+    """Shut down the shared client's persistent op session, if any.
+
+    Entry points call this once their work is done so a long-lived op
+    child isn't left running after the program exits. A no-op when the
+    client was never constructed or session mode is off.
+    """
+    if _default_client is not None:
+        await _default_client.aclose()
+
+
 class BaseOpHandler:
     """Base class for 1Password CLI handlers with common command execution patterns"""
-    
-    def __init__(self, resource_type: str):
+
+    def __init__(self, resource_type: str, client: Optional[OpClient] = None):
         """
         Args:
             resource_type: The type of resource (e.g., "user", "group", "item")
+            client: Optional shared OpClient; defaults to the module-level one
         """
         self.resource_type = resource_type
-        self.client = OpClient()
+        self.client = client or get_default_client()
+        # TTL cache for idempotent reads; the epoch is bumped by any mutating
+        # call so stale entries can't outlive a create/delete/grant/etc.
+        self._cache: Dict[Tuple, Tuple[float, Any]] = {}
+        self._cache_epoch = 0
 
     async def _execute(
         self,
@@ -27,21 +112,46 @@ class BaseOpHandler:
             subcommand: The subcommand to execute (e.g., "list", "get")
             args: Optional positional arguments
             options: Optional key-value pairs for command options
+
+        Idempotent subcommands (list/get) are served from a short TTL cache;
+        any mutating subcommand clears it so reads never go stale.
         """
+        cacheable = subcommand in _IDEMPOTENT_SUBCOMMANDS
+        cache_key = None
+        if cacheable:
+            cache_key = (
+                self._cache_epoch,
+                subcommand,
+                tuple(args or ()),
+                frozenset((options or {}).items()),
+            )
+            cached = self._cache.get(cache_key)
+            if cached is not None and cached[0] > time.monotonic():
+                return cached[1]
+
         cmd = (
             CommandBuilder(self.resource_type)
             .subcommand(subcommand)
         )
-        
+
         # Add positional args
         if args:
             for arg in args:
                 cmd.arg(arg)
-                
+
         # Add options
         if options:
             for key, value in options.items():
                 if value is not None:  # Only add options with values
                     cmd.option(key, value)
-        
-        return await self.client.execute_command(cmd.build()) 
\ No newline at end of file
+
+        result = await self.client.execute_command(cmd.build())
+
+        if cacheable:
+            self._cache[cache_key] = (time.monotonic() + _CACHE_TTL_SECONDS, result)
+        else:
+            # A mutation may have changed anything this handler cached
+            self._cache_epoch += 1
+            self._cache.clear()
+
+        return result 
\ No newline at end of file
@@ -1,10 +1,8 @@
-from dataclasses import dataclass
 from typing import List, Optional, Union, Any
 
-@dataclass
 class CommandBuilder:
     """Builder for 1Password CLI commands"""
-    
+
     def __init__(self, base_command: str):
         self._command: List[str] = [base_command]
         self._format: str = "json"
@@ -39,13 +37,9 @@ class CommandBuilder:
         return self
     
     def build(self) -> List[str]:
-        """Build the final command list"""
-        cmd = self._command.copy()
-        
-        if self._format:
-            cmd.extend(["--format", self._format])
-            
-        if self._account:
-            cmd.extend(["--account", self._account])
-            
-        return cmd
+        """Build the final command list in a single pass"""
+        return [
+            *self._command,
+            *(("--format", self._format) if self._format else ()),
+            *(("--account", self._account) if self._account else ()),
+        ]
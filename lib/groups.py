@@ -2,10 +2,13 @@ import logging
 from typing import List, Optional
 
 from optypes.op_types import GroupDetails, GroupOverview
-from lib.base_handler import BaseOpHandler
+from lib.base_handler import BaseOpHandler, translate_errors
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on user IDs sent per CLI call to stay well clear of ARG_MAX
+_USER_BATCH_SIZE = 50
+
 class GroupOperationError(Exception):
     """Raised when group operations fail"""
     pass
@@ -17,8 +20,8 @@ class GroupNotFoundError(GroupOperationError):
 class GroupHandler(BaseOpHandler):
     """Handles operations related to 1Password groups"""
 
-    def __init__(self):
-        super().__init__(resource_type="group")
+    def __init__(self, client=None):
+        super().__init__(resource_type="group", client=client)
 
     async def list(self) -> List[GroupOverview]:
         """List all groups"""
@@ -29,19 +32,14 @@ class GroupHandler(BaseOpHandler):
             logger.error(f"Failed to list groups: {str(e)}")
             raise GroupOperationError("Failed to retrieve groups list") from e
 
+    @translate_errors(GroupNotFoundError, GroupOperationError, "group")
     async def get(self, group_id: str) -> GroupDetails:
         """Get details for a specific group"""
-        try:
-            group_json = await self._execute(
-                subcommand="get",
-                args=[group_id]
-            )
-            return GroupDetails(**group_json)
-        except Exception as e:
-            if "not found" in str(e).lower():
-                raise GroupNotFoundError(f"Group {group_id} not found")
-            logger.error(f"Failed to get group {group_id}: {str(e)}")
-            raise GroupOperationError(f"Failed to retrieve group {group_id}") from e
+        group_json = await self._execute(
+            subcommand="get",
+            args=[group_id]
+        )
+        return GroupDetails(**group_json)
 
     async def create(self, name: str, description: Optional[str] = None) -> GroupDetails:
         """Create a new group"""
@@ -57,61 +55,50 @@ class GroupHandler(BaseOpHandler):
             logger.error(f"Failed to create group {name}: {str(e)}")
             raise GroupOperationError(f"Failed to create group {name}") from e
 
+    @translate_errors(GroupNotFoundError, GroupOperationError, "group")
     async def delete(self, group_id: str) -> None:
         """Delete a group"""
-        try:
-            await self._execute(
-                subcommand="delete",
-                args=[group_id]
-            )
-        except Exception as e:
-            if "not found" in str(e).lower():
-                raise GroupNotFoundError(f"Group {group_id} not found")
-            logger.error(f"Failed to delete group {group_id}: {str(e)}")
-            raise GroupOperationError(f"Failed to delete group {group_id}") from e
+        await self._execute(
+            subcommand="delete",
+            args=[group_id]
+        )
 
+    @translate_errors(GroupNotFoundError, GroupOperationError, "group")
     async def add_users(self, group_id: str, user_ids: List[str]) -> None:
         """Add users to a group
-        
+
         Args:
             group_id: ID of the group
             user_ids: List of user IDs to add to the group
-            
+
         Raises:
             GroupNotFoundError: If group doesn't exist
             GroupOperationError: If operation fails
         """
-        try:
-            for user_id in user_ids:
-                await self._execute(
-                    subcommand="user",
-                    args=["add", user_id, group_id]
-                )
-        except Exception as e:
-            if "not found" in str(e).lower():
-                raise GroupNotFoundError(f"Group {group_id} not found")
-            logger.error(f"Failed to add users to group {group_id}: {str(e)}")
-            raise GroupOperationError(f"Failed to add users to group {group_id}") from e
+        # One CLI call per batch of IDs instead of one per user
+        for start in range(0, len(user_ids), _USER_BATCH_SIZE):
+            batch = user_ids[start:start + _USER_BATCH_SIZE]
+            await self._execute(
+                subcommand="user",
+                args=["add", ",".join(batch), group_id]
+            )
 
+    @translate_errors(GroupNotFoundError, GroupOperationError, "group")
     async def remove_users(self, group_id: str, user_ids: List[str]) -> None:
         """Remove users from a group
-        
+
         Args:
             group_id: ID of the group
             user_ids: List of user IDs to remove from the group
-            
+
         Raises:
             GroupNotFoundError: If group doesn't exist
             GroupOperationError: If operation fails
         """
-        try:
-            for user_id in user_ids:
-                await self._execute(
-                    subcommand="user",
-                    args=["remove", user_id, group_id]
-                )
-        except Exception as e:
-            if "not found" in str(e).lower():
-                raise GroupNotFoundError(f"Group {group_id} not found")
-            logger.error(f"Failed to remove users from group {group_id}: {str(e)}")
-            raise GroupOperationError(f"Failed to remove users from group {group_id}") from e 
\ No newline at end of file
+        # One CLI call per batch of IDs instead of one per user
+        for start in range(0, len(user_ids), _USER_BATCH_SIZE):
+            batch = user_ids[start:start + _USER_BATCH_SIZE]
+            await self._execute(
+                subcommand="user",
+                args=["remove", ",".join(batch), group_id]
+            ) 
\ No newline at end of file
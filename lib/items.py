@@ -1,13 +1,19 @@
 import logging
 import json
 import asyncio
-from typing import List, Optional, Dict, Any
+import time
+from typing import List, Optional, Dict, Any, Union
 from dataclasses import dataclass
 
 from optypes.op_types import BaseHandler, Item
-from util.utils import AsyncExecutor
+from util.utils import (
+    AsyncExecutor,
+    iter_chunks,
+    optimal_chunk_size,
+    record_chunk_latency,
+)
 from lib.command_builder import CommandBuilder
-from lib.base_handler import BaseOpHandler
+from lib.base_handler import BaseOpHandler, translate_errors
 
 logger = logging.getLogger(__name__)
 
@@ -32,8 +38,11 @@ class ItemSearchResult:
 class ItemHandler(BaseOpHandler):
     """Handles operations related to 1Password items"""
 
-    def __init__(self):
-        super().__init__(resource_type="item")
+    def __init__(self, client=None):
+        super().__init__(resource_type="item", client=client)
+        # Handler-wide bound on the per-item gets issued when a batched
+        # get has to degrade, shared across concurrently-failing batches.
+        self._fallback_semaphore = asyncio.Semaphore(8)
 
     async def list(self, vault_id: Optional[str] = None) -> List[Item]:
         """List items, optionally filtered by vault"""
@@ -47,51 +56,123 @@ class ItemHandler(BaseOpHandler):
             logger.error(f"Failed to list items: {str(e)}")
             raise ItemOperationError("Failed to retrieve items list") from e
 
-    async def get(self, item_id: str) -> Item:
-        """Get details for a specific item"""
+    @translate_errors(ItemNotFoundError, ItemOperationError, "item")
+    async def get(self, item_id: Union[str, List[str]]) -> Union[Item, List[Item]]:
+        """Get details for one or more items
+
+        Args:
+            item_id: A single item ID, or a list of IDs to fetch in one
+                CLI invocation
+
+        Returns:
+            An Item for a single ID, or a list of Items when given a list
+        """
+        if isinstance(item_id, list):
+            return await self._get_batch(item_id)
+        item_json = await self._execute(
+            subcommand="get",
+            args=[item_id]
+        )
+        return Item(**item_json)
+
+    async def _get_batch(self, item_ids: List[str]) -> List[Item]:
+        """Fetch several items in one CLI call, degrading per item on failure
+
+        A multi-ID get fails as a unit: concatenated output doesn't parse
+        as the single JSON document the client expects, and one missing ID
+        errors the whole invocation. When the batch call fails for any
+        reason, fall back to per-item gets so a bad ID costs only itself -
+        the same behavior per-item fetching had before batching.
+        """
         try:
             item_json = await self._execute(
                 subcommand="get",
-                args=[item_id]
+                args=item_ids
             )
-            return Item(**item_json)
         except Exception as e:
-            if "not found" in str(e).lower():
-                raise ItemNotFoundError(f"Item {item_id} not found")
-            logger.error(f"Failed to get item {item_id}: {str(e)}")
-            raise ItemOperationError(f"Failed to retrieve item {item_id}") from e
+            logger.warning(
+                f"Batched get for {len(item_ids)} items failed ({e}); "
+                "retrying items individually"
+            )
+
+            # The per-item retries are independent subprocess calls - run
+            # them concurrently under the handler's semaphore rather than
+            # one awaited get at a time.
+            async def fetch_one(single_id: str) -> Optional[Item]:
+                async with self._fallback_semaphore:
+                    try:
+                        return await self.get(single_id)
+                    except (ItemNotFoundError, ItemOperationError) as item_error:
+                        logger.error(f"Skipping item {single_id}: {item_error}")
+                        return None
+
+            fetched = await asyncio.gather(
+                *(fetch_one(single_id) for single_id in item_ids)
+            )
+            return [item for item in fetched if item is not None]
+
+        items_json = item_json if isinstance(item_json, list) else [item_json]
+        return [Item(**item) for item in items_json]
+
+    async def _timed_batch_get(self, item_ids: List[str]) -> List[Item]:
+        """Batched get that reports its wall time to the 'item_get' tuner
+
+        Timed here, around the single call, so the tuner sees the latency
+        of exactly the unit it sizes - even when list_with_details keeps
+        two batches in flight at once.
+        """
+        start = time.perf_counter()
+        items = await self.get(item_ids)
+        record_chunk_latency(
+            "item_get", len(item_ids), time.perf_counter() - start
+        )
+        return items
 
     async def list_with_details(
-        self, 
+        self,
         vault_id: Optional[str] = None,
-        chunk_size: int = 10
+        chunk_size: Optional[int] = None
     ) -> List[Item]:
         """List items with full details, handling pagination
-        
+
         Args:
             vault_id: Optional vault ID to filter items
-            chunk_size: Number of items to process concurrently
-            
+            chunk_size: Number of items to process concurrently; defaults to
+                the latency-tuned size for item fetches
+
         Returns:
             List of Item objects with full details
         """
+        if chunk_size is None:
+            chunk_size = optimal_chunk_size("item_get")
         items = await self.list(vault_id)
         
         if not items:
             return []
 
-        chunks = [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
-        
         detailed_items: List[Item] = []
-        for chunk in chunks:
-            tasks = [self.get(item.id) for item in chunk]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            
-            for result in results:
-                if isinstance(result, Exception):
-                    logger.error(f"Failed to get item details: {result}")
-                    continue
-                detailed_items.append(result)
+
+        # One subprocess per chunk of IDs beats one subprocess per item -
+        # the fork/exec/auth overhead dominates the actual fetch. Keeping the
+        # next chunk's fetch in flight while awaiting the current one hides
+        # the subprocess launch latency between chunks.
+        in_flight: Optional[asyncio.Task] = None
+        for chunk in iter_chunks(items, chunk_size):
+            fetch = asyncio.ensure_future(
+                self._timed_batch_get([item.id for item in chunk])
+            )
+            if in_flight is not None:
+                try:
+                    detailed_items.extend(await in_flight)
+                except Exception as e:
+                    logger.error(f"Failed to get item details: {e}")
+            in_flight = fetch
+
+        if in_flight is not None:
+            try:
+                detailed_items.extend(await in_flight)
+            except Exception as e:
+                logger.error(f"Failed to get item details: {e}")
 
         return detailed_items
 
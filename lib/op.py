@@ -1,16 +1,73 @@
+import functools
 import logging
 import asyncio
 import json
+import random
+import re
+import shlex
 import subprocess
+import threading
 import os
-from typing import List, Optional, Union, Any, Dict
+from typing import List, Optional, Sequence, Union, Any, Dict
 from dataclasses import dataclass
 
+try:
+    import orjson  # noqa: F401 - optional, ~2-5x faster on large payloads
+except ImportError:
+    orjson = None
+
+
+@functools.lru_cache(maxsize=256)
+def _split_command(cmd: str) -> tuple:
+    """Tokenize a command string, honouring quoting
+
+    The handlers re-issue the same handful of command shapes constantly,
+    so the split results are cached.
+    """
+    return tuple(shlex.split(cmd))
+
+
+def _loads(data: bytes) -> Any:
+    """Decode JSON from raw CLI output bytes, preferring orjson"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 # Define SubprocessError type - only use subprocess.SubprocessError
 SubprocessError = subprocess.SubprocessError
 
 logger = logging.getLogger(__name__)
 
+# Various forms the CLI uses to say "you're not signed in". had a few bugs
+# with this lole. Compiled once so the error path doesn't lowercase and scan
+# the message three times per failure.
+_AUTH_ERR_RE = re.compile(
+    r"not currently signed in|account is not signed in|not signed in",
+    re.IGNORECASE,
+)
+
+_NOT_FOUND_RE = re.compile(r"not found", re.IGNORECASE)
+
+# The CLI's rate-limit message sometimes states its own cool-down, e.g.
+# "rate limit exceeded, try again in 30 seconds".
+_RETRY_AFTER_RE = re.compile(
+    r"(?:try again|retry)\s+(?:in|after)\s+(\d+)", re.IGNORECASE
+)
+
+# 'op --version' prints e.g. '2.25.0', but newer builds may append build
+# metadata - match just the leading semver triple, on the raw bytes.
+_VERSION_RE = re.compile(rb"(\d+)\.(\d+)\.(\d+)")
+
+# Payloads above this are decoded in a worker thread so a multi-MB item
+# list doesn't stall every other coroutine on the loop.
+_JSON_THREAD_THRESHOLD = 64_000
+
+# Longest a persistent-session command may take before the session is
+# abandoned. A command that fails in-session writes only to stderr (which
+# session mode discards), so without a deadline the read would hang forever
+# while holding the session lock.
+_PERSISTENT_READ_TIMEOUT = 30.0
+
 class OpClientError(Exception):
     """Base exception for 1Password CLI errors"""
     pass
@@ -23,6 +80,10 @@ class OpCommandError(OpClientError):
     """Raised when a 1Password CLI command fails"""
     pass
 
+class OpNotFoundError(OpCommandError):
+    """Raised when the CLI reports the requested resource doesn't exist"""
+    pass
+
 class AuthenticationError(OpClientError):
     """Raised when authentication is required or fails"""
     pass
@@ -54,26 +115,189 @@ class OpClient:
     
     MIN_VERSION = CliVersion(2, 25, 0)
 
-    def __init__(self, account: Optional[str] = None, service_account_token: Optional[str] = None):
+    # The installed CLI doesn't change while the process is running, so the
+    # version check only needs to happen once no matter how many clients exist.
+    _verified_version: Optional[CliVersion] = None
+    _version_lock = threading.Lock()
+
+    def __init__(
+        self,
+        account: Optional[str] = None,
+        service_account_token: Optional[str] = None,
+        persistent_session: bool = False,
+    ):
+        """
+        Args:
+            account: Optional account shorthand/ID passed to every command
+            service_account_token: Optional service account token
+            persistent_session: Feed commands to one long-lived op process
+                over stdin instead of forking per call. Off by default -
+                falls back to per-call execution if the CLI rejects it.
+        """
         self.account = account
         self.service_account_token = service_account_token
+        self.persistent_session = persistent_session
+        self._persistent_proc: Optional[asyncio.subprocess.Process] = None
+        self._persistent_lock: Optional[asyncio.Lock] = None
+        self._env: Optional[Dict[str, str]] = None
         self._verify_cli_version()
 
+    def _subprocess_env(self) -> Optional[Dict[str, str]]:
+        """Environment for op subprocesses; None means inherit unchanged
+
+        Copying os.environ per call is wasted work unless a service account
+        token has to be injected, and even then the dict is stable for the
+        client's lifetime, so it's built once and reused.
+        """
+        if not self.service_account_token:
+            return None
+        if self._env is None:
+            self._env = {
+                **os.environ,
+                "OP_SERVICE_ACCOUNT_TOKEN": self.service_account_token,
+            }
+        return self._env
+
     def _verify_cli_version(self) -> None:
-        """Verify the installed op CLI meets minimum version requirements"""
-        try:
-            result = subprocess.run(['op', '--version'], capture_output=True, text=True)
-            version = CliVersion.from_string(result.stdout)
-            if not version.meets_minimum(self.MIN_VERSION):
-                raise OpVersionError(
-                    f"1Password CLI version {version} is below minimum required {self.MIN_VERSION}"
+        """Verify the installed op CLI meets minimum version requirements
+
+        The result is cached at class level so only the first OpClient
+        constructed in the process pays for the `op --version` subprocess.
+        """
+        if OpClient._verified_version is not None:
+            return
+
+        with OpClient._version_lock:
+            if OpClient._verified_version is not None:
+                return
+
+            try:
+                # No text=True: skip the codec machinery for a ~10-byte read
+                result = subprocess.run(
+                    ['op', '--version'],
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                    check=False,
                 )
-        except FileNotFoundError as e:
-            raise OpClientError("1Password CLI not found. Please install it first.") from e
+                match = _VERSION_RE.match(result.stdout.strip())
+                if not match:
+                    raise OpVersionError(
+                        f"Invalid version format: {result.stdout!r}"
+                    )
+                version = CliVersion(*map(int, match.groups()))
+                if not version.meets_minimum(self.MIN_VERSION):
+                    raise OpVersionError(
+                        f"1Password CLI version {version} is below minimum required {self.MIN_VERSION}"
+                    )
+                OpClient._verified_version = version
+            except FileNotFoundError as e:
+                raise OpClientError("1Password CLI not found. Please install it first.") from e
+
+    async def _get_persistent_proc(self) -> Optional[asyncio.subprocess.Process]:
+        """Spawn (once) the long-lived op process used for session mode
+
+        Returns None if the process can't be started, in which case callers
+        fall back to per-call execution.
+        """
+        if self._persistent_proc is not None and self._persistent_proc.returncode is None:
+            return self._persistent_proc
+
+        try:
+            self._persistent_proc = await asyncio.create_subprocess_exec(
+                'op',
+                '--format=json',
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+                env=self._subprocess_env(),
+            )
+        except (OSError, SubprocessError) as e:
+            logger.debug(f"Persistent op session unavailable: {e}")
+            self.persistent_session = False
+            self._persistent_proc = None
+        return self._persistent_proc
+
+    async def _execute_persistent(self, argv: List[str]) -> Optional[Any]:
+        """Run one command through the long-lived op process
+
+        Commands are shell-quoted and newline-delimited on stdin.
+        Responses are framed on trailing newlines: the buffer is only
+        parsed once it ends in one, and only a parse that consumes the
+        *whole* buffer is accepted - parsing an arbitrary prefix could
+        return truncated data and permanently desync the stream. A read
+        deadline covers commands that die writing only to stderr; on any
+        failure or timeout the child is killed and session mode disabled
+        so callers fall back to per-call execution.
+        """
+        if self._persistent_lock is None:
+            self._persistent_lock = asyncio.Lock()
+
+        async with self._persistent_lock:
+            proc = await self._get_persistent_proc()
+            if proc is None:
+                return None
+
+            try:
+                # shlex.join so arguments containing spaces survive the trip
+                proc.stdin.write((shlex.join(argv) + "\n").encode())
+                await proc.stdin.drain()
+
+                buffer = b""
+                while True:
+                    data = await asyncio.wait_for(
+                        proc.stdout.read(65536),
+                        timeout=_PERSISTENT_READ_TIMEOUT,
+                    )
+                    if not data:
+                        raise OpCommandError("Persistent op session closed unexpectedly")
+                    buffer += data
+                    if not buffer.endswith(b"\n"):
+                        continue  # Document still in flight
+                    try:
+                        return _loads(buffer)
+                    except ValueError:
+                        continue  # Not one complete document yet, keep reading
+            except (
+                OSError,
+                SubprocessError,
+                OpCommandError,
+                asyncio.TimeoutError,
+            ) as e:
+                logger.debug(f"Persistent op session failed, falling back: {e}")
+                self.persistent_session = False
+                if (
+                    self._persistent_proc is not None
+                    and self._persistent_proc.returncode is None
+                ):
+                    self._persistent_proc.kill()
+                self._persistent_proc = None
+                return None
+
+    async def aclose(self) -> None:
+        """Shut down the persistent op session, if one is running
+
+        Closing stdin lets the child exit on its own; if it hasn't within a
+        few seconds it's killed. Safe to call when session mode is off or
+        the process already died.
+        """
+        proc = self._persistent_proc
+        self._persistent_proc = None
+        if proc is None or proc.returncode is not None:
+            return
+        try:
+            if proc.stdin is not None:
+                proc.stdin.close()
+            try:
+                await asyncio.wait_for(proc.wait(), timeout=5)
+            except asyncio.TimeoutError:
+                proc.kill()
+                await proc.wait()
+        except (OSError, SubprocessError) as e:
+            logger.debug(f"Error closing persistent op session: {e}")
 
     async def execute_command(
-        self, 
-        command: List[str], 
+        self,
+        command: List[str],
         input_data: Optional[Union[str, bytes]] = None,
         decode_json: bool = True
     ) -> Any:
@@ -91,22 +315,30 @@ class OpClient:
             OpCommandError: If the command fails
             AuthenticationError: If authentication is required
         """
-        env = os.environ.copy()
-        if self.service_account_token:
-            env["OP_SERVICE_ACCOUNT_TOKEN"] = self.service_account_token
-
+        # Build a fresh argv rather than extending the caller's list - retry
+        # paths reuse the same command object, and mutating it here appended
+        # a duplicate --account pair on every attempt.
+        argv = list(command)
         if self.account:
-            command.extend(['--account', self.account])
+            argv += ['--account', self.account]
+
+        # Session mode amortizes fork/exec/auth across calls; only usable
+        # for plain JSON commands with no stdin payload.
+        if self.persistent_session and input_data is None and decode_json:
+            result = await self._execute_persistent(argv)
+            if result is not None:
+                return result
 
         try:
-            logger.debug(f"Executing op command: {' '.join(command)}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Executing op command: {' '.join(argv)}")
             process = await asyncio.create_subprocess_exec(
                 'op',
-                *command,
+                *argv,
                 stdin=asyncio.subprocess.PIPE if input_data else None,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
-                env=env
+                env=self._subprocess_env()
             )
 
             stdout, stderr = await process.communicate(
@@ -115,14 +347,7 @@ class OpClient:
 
             if process.returncode != 0:
                 error_msg = stderr.decode().strip()
-                # Check for various forms of authentication errors. had a few bugs with this lole
-                auth_error_messages = [
-                    "not currently signed in",
-                    "account is not signed in",
-                    "not signed in",
-                ]
-                
-                if any(msg in error_msg.lower() for msg in auth_error_messages):
+                if _AUTH_ERR_RE.search(error_msg):
                     raise AuthenticationError(
                         "Please authenticate with 1Password CLI first using 'op signin'"
                     )
@@ -135,21 +360,28 @@ class OpClient:
                 )
                 logger.debug(f"Full CLI error: {stderr.decode()}")
                 logger.error(f"Command failed: {error_msg}")
+                if _NOT_FOUND_RE.search(error_msg):
+                    # Typed so handlers can catch it without string-sniffing
+                    raise OpNotFoundError(f"Command failed: {error_msg}")
                 raise OpCommandError(f"Command failed: {error_msg}")
 
-            output = stdout.decode().strip()
-            
+            # Work on the raw bytes - decoding the whole payload to str just
+            # to hand it to the JSON parser doubles the copies for large lists.
+            output = stdout.strip()
+
             if not output:
                 return None
-                
+
             if decode_json:
                 try:
-                    return json.loads(output)
-                except json.JSONDecodeError as e:
-                    logger.error(f"Failed to decode JSON output: {output}")
+                    if len(output) > _JSON_THREAD_THRESHOLD:
+                        return await asyncio.to_thread(_loads, output)
+                    return _loads(output)
+                except ValueError as e:
+                    logger.error(f"Failed to decode JSON output: {output!r}")
                     raise OpCommandError("Failed to decode command output as JSON") from e
-            
-            return output
+
+            return output.decode()
 
         except (OSError, SubprocessError) as e:
             logger.error(f"Failed to execute command: {e}")
@@ -164,24 +396,41 @@ class OpClient:
         """Synchronous version of execute_command"""
         return asyncio.run(self.execute_command(command, input_data, decode_json))
 
-    async def run_command_async(self, cmd: str) -> Union[Dict[str, Any], list]:
+    async def run_command_async(
+        self, cmd: Union[str, Sequence[str]]
+    ) -> Union[Dict[str, Any], list]:
         """Run a 1Password CLI command asynchronously
-        
+
         Args:
-            cmd: Command string to execute
-            
+            cmd: Command to execute, either a pre-tokenized argv sequence or
+                a string (split with shlex so quoted arguments survive)
+
         Returns:
             Parsed JSON response from command
-            
+
         Raises:
             AuthenticationError: If authentication is required
             OpCommandError: If command execution fails
         """
-        # Split command string and add base command
-        full_cmd = cmd.split()
-        full_cmd.extend(["--format=json"])
-        
-        return await self.execute_command(full_cmd, decode_json=True)
+        return await self.execute_command(
+            self._prepare_command(cmd), decode_json=True
+        )
+
+    def _prepare_command(self, cmd: Union[str, Sequence[str]]) -> List[str]:
+        """Tokenize a command and ensure JSON output is requested"""
+        if isinstance(cmd, str):
+            full_cmd = list(_split_command(cmd))
+        else:
+            full_cmd = list(cmd)
+
+        # Don't stack a second --format flag if the caller already set one
+        if not any(
+            part == "--format" or part.startswith("--format=")
+            for part in full_cmd
+        ):
+            full_cmd.append("--format=json")
+
+        return full_cmd
 
     def run_command(self, cmd: str) -> Any:
         """Run a command synchronously"""
@@ -193,13 +442,27 @@ class OpClient:
             logger.error(f"Command failed: {str(e)}")
             raise
 
-    async def run_multiple_commands(self, commands: List[str]) -> List[str]:
+    async def run_multiple_commands(
+        self, commands: List[str], max_concurrency: int = 16
+    ) -> List[Any]:
         """
         Run multiple commands concurrently and return the JSON responses.
         Use this when you want to.. well, run multiple commands at once, side-by-side.
+
+        Concurrency is bounded so a large command list doesn't try to fork
+        them all at once (exhausting FDs and tripping CLI rate limits), and
+        each command gets its own rate-limit retries instead of one 429
+        failing the whole batch.
         """
-        tasks = [self.run_command_async(cmd) for cmd in commands]
-        return await asyncio.gather(*tasks)
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run_one(cmd: str) -> Any:
+            async with semaphore:
+                return await self.execute_with_rate_limit(
+                    self._prepare_command(cmd)
+                )
+
+        return await asyncio.gather(*(run_one(cmd) for cmd in commands))
 
     async def execute_with_rate_limit(
         self,
@@ -224,12 +487,21 @@ class OpClient:
             try:
                 return await self.execute_command(command)
             except OpCommandError as e:
-                if "rate limit exceeded" in str(e).lower():
+                message = str(e)
+                if "rate limit exceeded" in message.lower():
                     if attempt == max_retries:
                         logger.error("Rate limit retries exhausted")
                         raise
-                        
-                    delay = initial_delay * (2 ** attempt)  # Exponential backoff
+
+                    # Prefer the server's own cool-down when the message
+                    # states one; otherwise full-jitter exponential backoff
+                    # so concurrent commands don't retry in lockstep and
+                    # re-collide on every attempt.
+                    retry_after = _RETRY_AFTER_RE.search(message)
+                    if retry_after:
+                        delay = float(retry_after.group(1)) + random.uniform(0, 0.5)
+                    else:
+                        delay = random.uniform(0, initial_delay * (2 ** attempt))
                     logger.warning(f"Rate limit hit, retrying in {delay:.1f}s")
                     await asyncio.sleep(delay)
                     continue
@@ -1,8 +1,15 @@
 import logging
-from dataclasses import fields
-from typing import Any, Awaitable, Callable, Dict, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
-from optypes.op_types import PermissionOperator, Permissions, TestingItems
+import click
+
+from optypes.op_types import (
+    PERMISSION_SET,
+    PERMISSION_VALUES,
+    PermissionOperator,
+    Permissions,
+    TestingItems,
+)
 from util.utils import async_input, run_async
 
 from .actions import Actions
@@ -45,14 +52,37 @@ class Router:
         },
     }
 
+    # AVAILABLE_ACTIONS is a class constant, so the help listing can be
+    # built once at class-body time instead of per prompt render.
+    HELP_TEXT = "\n".join(
+        f"{i + 1}. {action.ljust(25)} - {details['help']}"
+        for i, (action, details) in enumerate(AVAILABLE_ACTIONS.items())
+    )
+
     def __init__(self, testing: bool = False) -> None:
         self.testing = testing
-        self.actions = Actions(testing)
-        self.permission_opts = [
-            Permissions.ALLOW_VIEWING,
-            Permissions.EXPORT_ITEMS,
-            *[getattr(Permissions, field.name) for field in fields(Permissions)]
-        ]
+        # Actions construction reaches out to the CLI (client setup), so
+        # defer it until an action actually runs - rendering --help
+        # shouldn't spawn subprocesses.
+        self._actions: Optional[Actions] = None
+        # PERMISSION_VALUES already contains every permission exactly once -
+        # the old concatenation duplicated ALLOW_VIEWING and EXPORT_ITEMS.
+        self.permission_opts = PERMISSION_VALUES
+        # Bound-method table so run_action is a dict lookup, not getattr
+        self._run_methods = {
+            action: getattr(self, details["run"])
+            for action, details in self.AVAILABLE_ACTIONS.items()
+        }
+
+    @property
+    def actions(self) -> Actions:
+        if self._actions is None:
+            self._actions = Actions(self.testing)
+        return self._actions
+
+    @actions.setter
+    def actions(self, value: Actions) -> None:
+        self._actions = value
 
     def post_init_checks(self, testing: bool):
         self.actions = Actions(testing)
@@ -67,7 +97,8 @@ class Router:
         Returns:
             Any: The result of the action.
         """
-        if action not in self.AVAILABLE_ACTIONS:
+        run_coro: Optional[Callable[[], Awaitable[Any]]] = self._run_methods.get(action)
+        if run_coro is None:
             logging.error(f"Action '{action}' not found.")
             raise ValueError(f"Action '{action}' not found.")
 
@@ -75,8 +106,6 @@ class Router:
             self.actions is not None
         ), "Make sure post_init_checks is being run"
 
-        run_coro: Callable[[], Awaitable[Any]] = getattr(self, self.AVAILABLE_ACTIONS[action]["run"])
-
         logging.info(f"Executing action: {action}")
         return run_async(run_coro())
 
@@ -87,12 +116,7 @@ class Router:
         Returns:
             str: The help text string.
         """
-        return "\n".join(
-            [
-                f"{i + 1}. {action.ljust(25)} - {details['help']}"
-                for i, (action, details) in enumerate(self.AVAILABLE_ACTIONS.items())
-            ]
-        )
+        return self.HELP_TEXT
 
     async def run_ir_cred_search_all_vaults(self) -> Any:
         if not self.testing:
@@ -130,46 +154,64 @@ class Router:
     async def run_ir_complete(self) -> Any:
         return await self.actions.ir_complete()
 
-    async def run_user_permission_update(self) -> Any:
-        try:
-            if not self.testing:
-                vault_id = await async_input("Enter vault ID: ")
-                action_input = await async_input(
-                    f"What action would you like to take?\n {list(self.ACTION_OPERATORS.values())}\n\n"
-                )
+    def collect_user_permission_inputs(
+        self,
+    ) -> Tuple[str, PermissionOperator, List[str]]:
+        """Prompt for permission-update inputs via the sync click layer
+
+        These prompts happen before any concurrent work starts, so pushing
+        each one through a thread executor (async_input) only added a
+        thread hand-off per question.
+        """
+        vault_id = click.prompt("Enter vault ID")
+        action_input = click.prompt(
+            f"What action would you like to take?\n {list(self.ACTION_OPERATORS)}\n"
+        )
 
-                if action_input not in self.ACTION_OPERATORS.values():
-                    raise InvalidActionError(f"Invalid action: {action_input}")
+        if action_input not in self.ACTION_OPERATORS:
+            raise InvalidActionError(f"Invalid action: {action_input}")
 
-                permissions_input = await async_input(
-                    f"Provide a comma separated list of permissions you want to take action on: \n{self.permission_opts}\n\n"
-                )
-                permissions = [
-                    permission.strip()
-                    for permission in permissions_input.split(",")
-                ]
-                invalid_permissions = [
-                    perm
-                    for perm in permissions
-                    if perm not in self.permission_opts
-                ]
-
-                if invalid_permissions:
-                    raise InvalidPermissionError(
-                        f"Invalid permissions provided: {', '.join(invalid_permissions)}"
-                    )
+        permissions_input = click.prompt(
+            "Provide a comma separated list of permissions you want to take "
+            f"action on: \n{self.permission_opts}\n"
+        )
+        permissions = [
+            permission.strip()
+            for permission in permissions_input.split(",")
+        ]
+        invalid_permissions = [
+            perm
+            for perm in permissions
+            if perm not in PERMISSION_SET
+        ]
 
-                action = self.ACTION_OPERATORS[action_input]
+        if invalid_permissions:
+            raise InvalidPermissionError(
+                f"Invalid permissions provided: {', '.join(invalid_permissions)}"
+            )
+
+        return vault_id, self.ACTION_OPERATORS[action_input], permissions
 
-            else:
+    async def run_user_permission_update(
+        self,
+        vault_id: Optional[str] = None,
+        action: Optional[PermissionOperator] = None,
+        permissions: Optional[List[str]] = None,
+    ) -> Any:
+        try:
+            if self.testing:
                 vault_id = TestingItems.TEST_VAULT_ID
-                action_input = await async_input("Enter (grant/revoke): \n\n")
+                action_input = click.prompt("Enter (grant/revoke)")
                 action = self.ACTION_OPERATORS[action_input]
                 permissions = [Permissions.EXPORT_ITEMS]
+            elif vault_id is None or action is None or permissions is None:
+                vault_id, action, permissions = (
+                    self.collect_user_permission_inputs()
+                )
 
             return await self.actions.update_user_permission(
                 vault_id=vault_id, action=action, permissions=permissions
             )
         except (InvalidActionError, InvalidPermissionError) as e:
-            self.logger.error(str(e))
+            logging.error(str(e))
             raise
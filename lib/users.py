@@ -4,6 +4,7 @@ from dataclasses import dataclass
 
 from optypes.op_types import UserDetails, UserOverview
 from lib.base_handler import BaseOpHandler
+from lib.op import OpNotFoundError
 
 logger = logging.getLogger(__name__)
 
@@ -24,8 +25,8 @@ class UserFilter:
 class UserHandler(BaseOpHandler):
     """Handles operations related to 1Password users"""
 
-    def __init__(self):
-        super().__init__(resource_type="user")
+    def __init__(self, client=None):
+        super().__init__(resource_type="user", client=client)
 
     async def list(
         self, 
@@ -41,7 +42,15 @@ class UserHandler(BaseOpHandler):
                     "group": group_id
                 }
             )
-            return [UserOverview(**user) for user in users_json]
+            # CLI output is already well-formed; construct() skips the
+            # per-field validation pass on what can be thousands of rows.
+            overview_fields = UserOverview.__fields__
+            return [
+                UserOverview.construct(
+                    **{k: v for k, v in user.items() if k in overview_fields}
+                )
+                for user in users_json
+            ]
         except Exception as e:
             logger.error(f"Failed to list users: {str(e)}")
             raise UserOperationError("Failed to retrieve users list") from e
@@ -54,8 +63,8 @@ class UserHandler(BaseOpHandler):
                 args=[user_id]
             )
             return UserDetails(**user_json)
+        except OpNotFoundError:
+            raise UserNotFoundError(f"User {user_id} not found")
         except Exception as e:
-            if "not found" in str(e).lower():
-                raise UserNotFoundError(f"User {user_id} not found")
             logger.error(f"Failed to get user {user_id}: {str(e)}")
             raise UserOperationError(f"Failed to retrieve user {user_id}") from e
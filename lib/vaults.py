@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from typing import List, Optional, Dict, Any
 from dataclasses import dataclass
@@ -14,9 +15,31 @@ from optypes.op_types import (
 )
 from util.utils import AsyncExecutor
 from lib.base_handler import BaseOpHandler
+from lib.op import AuthenticationError, OpNotFoundError
 
 logger = logging.getLogger(__name__)
 
+# Above this many rows, model construction moves off the event loop so a
+# huge tenant listing doesn't stall concurrent tasks mid-build.
+_MODEL_BUILD_THREAD_THRESHOLD = 1000
+
+
+async def _build_models(model, rows) -> List[Any]:
+    """Construct models from trusted CLI rows, off-loop for large batches"""
+    model_fields = model.__fields__
+
+    def build():
+        return [
+            model.construct(
+                **{k: v for k, v in row.items() if k in model_fields}
+            )
+            for row in rows
+        ]
+
+    if len(rows) > _MODEL_BUILD_THREAD_THRESHOLD:
+        return await asyncio.to_thread(build)
+    return build()
+
 class VaultPermissionError(Exception):
     """Raised when vault permission operations fail"""
     pass
@@ -41,12 +64,17 @@ class VaultHandler(BaseOpHandler):
     The former is used when the command(group) has a subcommand (group).
     """
 
-    def __init__(self):
-        super().__init__(resource_type="vault")
+    def __init__(self, client=None):
+        super().__init__(resource_type="vault", client=client)
         self.executor = AsyncExecutor()
         self.group = self.Group(parent_handler=self)
         self.user = self.User(parent_handler=self)
         self.vaults = self
+        # Handler-wide bound on concurrent per-user permission calls. The
+        # callers above this already fan out per vault and per chunk; a
+        # semaphore local to each invocation would multiply with those
+        # layers instead of capping them.
+        self._user_permission_semaphore = asyncio.Semaphore(16)
 
     async def list(self, permissions: Optional[str] = None) -> List[VaultOverview]:
         """List vaults, optionally filtered by permissions"""
@@ -56,7 +84,9 @@ class VaultHandler(BaseOpHandler):
                 subcommand="list",
                 options=options
             )
-            return [VaultOverview(**vault) for vault in vaults_json]
+            # CLI output is already well-formed; construct() skips the
+            # per-field validation pass, which dominates on big tenants.
+            return await _build_models(VaultOverview, vaults_json)
         except Exception as e:
             logger.error(f"Failed to list vaults: {str(e)}")
             raise VaultOperationError("Failed to retrieve vaults list") from e
@@ -77,6 +107,8 @@ class VaultHandler(BaseOpHandler):
             cmd = f"vault get {vault_id}"
             vault_json = await self.client.run_command_async(cmd)
             return VaultDetails(**vault_json)
+        except OpNotFoundError as e:
+            raise VaultOperationError(f"Vault {vault_id} not found") from e
         except Exception as e:
             logger.error(f"Failed to get vault {vault_id}: {str(e)}")
             raise VaultPermissionError(f"Unable to access vault {vault_id}") from e
@@ -122,12 +154,29 @@ class VaultHandler(BaseOpHandler):
 
         try:
             vault_users_json = await self.client.run_command_async(cmd)
-            vault_users = [UserDetails(**vault) for vault in vault_users_json]
+            # construct() skips pydantic's per-field validation - on vaults
+            # with thousands of users that pass dominated the list call.
+            vault_users = await _build_models(UserDetails, vault_users_json)
             return vault_users
-        except (TypeError, KeyError) as e:
+        except (TypeError, KeyError, AttributeError) as e:
             logging.error(f"Failed to parse result into UserDetails: {e}")
             raise ValueError(f"Invalid response structure: {vault_users_json}")
 
+    async def _handle_vault_groups_list(self, vault: str) -> List[Dict[str, Any]]:
+        """List groups with access to a vault, including their permissions
+
+        Returns the CLI rows as-is - callers only probe name/id and the
+        permissions list, so there's no model worth validating into.
+        """
+        cmd = f"vault group list {vault}"
+        try:
+            return await self.client.run_command_async(cmd) or []
+        except Exception as e:
+            logger.error(f"Failed to list groups for vault {vault}: {e}")
+            raise VaultOperationError(
+                f"Failed to list groups for vault {vault}"
+            ) from e
+
     async def handle_vault_group_permission(
         self, action: PermissionOperator, vault_id: str, permission: str, group: str
     ) -> VaultPermissionUpdate:
@@ -136,6 +185,9 @@ class VaultHandler(BaseOpHandler):
             cmd = f"vault group {action.value} {vault_id} {group} --permissions {permission}"
             result = await self.client.run_command_async(cmd)
             return VaultPermissionUpdate(**result)
+        except AuthenticationError:
+            # Not a per-vault failure - let callers abort the whole batch
+            raise
         except Exception as e:
             logger.error(f"Failed to {action.value} group permission: {e}")
             raise VaultPermissionError(f"Failed to {action.value} group permission") from e
@@ -143,14 +195,28 @@ class VaultHandler(BaseOpHandler):
     async def handle_vault_user_permission(
         self, action: PermissionOperator, vault_id: str, users: List[UserDetails], permissions: str
     ) -> List[VaultUserPermissionUpdate]:
-        """Handle vault user permission updates"""
-        try:
-            results = []
-            for user in users:
-                cmd = f"vault user {action.value} {vault_id} {user.id} --permissions {permissions}"
+        """Handle vault user permission updates, fanning out across users
+
+        One subprocess per user is unavoidable, but they're independent, so
+        run them concurrently under the handler-wide semaphore instead of
+        serially.
+        """
+        async def update_one(user: UserDetails) -> VaultUserPermissionUpdate:
+            async with self._user_permission_semaphore:
+                cmd = (
+                    f"vault user {action.value} {vault_id} {user.id} "
+                    f"--permissions {permissions}"
+                )
                 result = await self.client.run_command_async(cmd)
-                results.append(VaultUserPermissionUpdate(**result))
-            return results
+                return VaultUserPermissionUpdate(**result)
+
+        try:
+            return list(
+                await asyncio.gather(*(update_one(user) for user in users))
+            )
+        except AuthenticationError:
+            # Not a per-user failure - let callers abort the whole batch
+            raise
         except Exception as e:
             logger.error(f"Failed to {action.value} user permission: {e}")
             raise VaultPermissionError(f"Failed to {action.value} user permission") from e
@@ -159,6 +225,10 @@ class VaultHandler(BaseOpHandler):
         def __init__(self, parent_handler):
             self.parent_handler = parent_handler
 
+        async def list(self, vault_id: str) -> List[Dict[str, Any]]:
+            """List groups (with permissions) that have access to a vault"""
+            return await self.parent_handler._handle_vault_groups_list(vault_id)
+
         async def revoke(
             self, vault_id: str, permission: str, group: str
         ) -> VaultPermissionUpdate:
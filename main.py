@@ -4,15 +4,15 @@ from typing import List, Optional
 
 import click
 
+from lib.base_handler import aclose_default_client
 from lib.router import Router
 from optypes.op_types import Item
-
-router = Router()
+from util.utils import run_async
 
 
 def parse_selection(selection: str) -> str:
     """Parse the user's input and return the corresponding action."""
-    actions = list(router.action_opts.keys())
+    actions = list(Router.AVAILABLE_ACTIONS.keys())
     if selection.isdigit():
         index = int(selection) - 1
         if 0 <= index < len(actions):
@@ -29,7 +29,7 @@ def parse_selection(selection: str) -> str:
 @click.option(
     "--selection",
     prompt="Please select which action you'd like to take:\n\n"
-    + router.get_help_text()
+    + Router.HELP_TEXT
     + "\n",
     show_choices=False,
 )
@@ -44,7 +44,12 @@ def main(selection: str, testing: bool):
     router = Router(testing)
     action = parse_selection(selection)
     click.echo(f"You selected: {action}")
-    result = router.run_action(action)
+    try:
+        result = router.run_action(action)
+    finally:
+        # The shared client may be holding a persistent op session open;
+        # close it instead of leaking the child process on exit.
+        run_async(aclose_default_client())
     if result:
         click.echo(result)
 
@@ -53,7 +58,7 @@ def show_help(ctx):
     click.echo(
         "Available actions, select either a number or enter the relevant command:\n"
     )
-    click.echo(router.get_help_text())
+    click.echo(Router.HELP_TEXT)
     ctx.exit()
 
 
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-import inspect
-from dataclasses import dataclass, field
+import sys
+from dataclasses import dataclass, field, fields
 from typing import Any, Callable, Dict, List, Optional
 from enum import Enum
 
@@ -53,19 +53,20 @@ class Command:
     def __repr__(self):
         return f"Command(name='{self.name}')"
 
-class SingletonMeta(type):
-# https://github.com/AmirLavasani/python-design-patterns/blob/main/singleton/singleton_metaclass.py
+# There is exactly one Commands tree per process; the old SingletonMeta
+# paid a metaclass dispatch + dict lookup on every Commands() reference.
+_COMMANDS_SINGLETON: Optional['Commands'] = None
 
-    _instances: dict = {}
 
-    def __call__(cls, *args, **kwargs):
-        if cls not in cls._instances:
-            cls._instances[cls] = super(SingletonMeta, cls).__call__(*args, **kwargs)
-        return cls._instances[cls]
-    
-@dataclass
-class Commands(metaclass=SingletonMeta):
-    root: CommandNode = field(default_factory=lambda: CommandNode(name="root"))
+class Commands:
+    root: CommandNode
+
+    def __new__(cls) -> 'Commands':
+        global _COMMANDS_SINGLETON
+        if _COMMANDS_SINGLETON is None:
+            _COMMANDS_SINGLETON = super().__new__(cls)
+            _COMMANDS_SINGLETON.root = CommandNode(name="root")
+        return _COMMANDS_SINGLETON
 
     def register_command_path(self, command_path: List[str], handler: Callable) -> None:
         current_node = self.root
@@ -107,22 +108,33 @@ class VaultCommand:
         self.BASE_COMMAND = self.commands.VAULT
         self.COMMANDS = self.BASE_COMMAND.sub_commands
 
-@dataclass
+# Interned so the permission strings compared on every update call hit the
+# pointer-equality fast path; frozen because these are constants.
+@dataclass(frozen=True)
 class Permissions():
-    ALLOW_VIEWING: str = "allow_viewing"
-    MANAGE_VAULT: str = "manage_vault"
-    ALLOW_EDITING: str = "allow_editing"
-    VIEW_ITEMS: str = "view_items"
-    CREATE_ITEMS: str = "create_items"
-    EDIT_ITEMS: str = "edit_items"
-    ARCHIVE_ITEMS: str = "archive_items"
-    DELETE_ITEMS: str = "delete_items"
-    VIEW_AND_COPY_PASSWORDS: str = "view_and_copy_passwords"
-    VIEW_ITEM_HISTORY: str = "view_item_history"
-    IMPORT_ITEMS: str = "import_items"
-    EXPORT_ITEMS: str = "export_items"
-    COPY_AND_SHARE_ITEMS: str = "copy_and_share_items"
-    PRINT_ITEMS: str = "print_items"
+    ALLOW_VIEWING: str = sys.intern("allow_viewing")
+    MANAGE_VAULT: str = sys.intern("manage_vault")
+    ALLOW_EDITING: str = sys.intern("allow_editing")
+    VIEW_ITEMS: str = sys.intern("view_items")
+    CREATE_ITEMS: str = sys.intern("create_items")
+    EDIT_ITEMS: str = sys.intern("edit_items")
+    ARCHIVE_ITEMS: str = sys.intern("archive_items")
+    DELETE_ITEMS: str = sys.intern("delete_items")
+    VIEW_AND_COPY_PASSWORDS: str = sys.intern("view_and_copy_passwords")
+    VIEW_ITEM_HISTORY: str = sys.intern("view_item_history")
+    IMPORT_ITEMS: str = sys.intern("import_items")
+    EXPORT_ITEMS: str = sys.intern("export_items")
+    COPY_AND_SHARE_ITEMS: str = sys.intern("copy_and_share_items")
+    PRINT_ITEMS: str = sys.intern("print_items")
+
+# All permission values, enumerated once at import instead of via getattr
+# reflection on every Router construction. The frozenset gives O(1)
+# membership checks when validating user input.
+PERMISSION_VALUES = tuple(
+    getattr(Permissions, perm_field.name) for perm_field in fields(Permissions)
+)
+PERMISSION_SET = frozenset(PERMISSION_VALUES)
+
 
 class PermissionOperator(Enum):
     GRANT = "grant"
@@ -130,7 +142,6 @@ class PermissionOperator(Enum):
 
 
 class TestingItems():
-    TEST_VAULT_ID: str = "u4ootfqult5kep6xlrs4sil7za"
     TEST_VAULT_ID: str = "4lgmhntcrfyquabprztyp5zwi4"
     TEST_ITEM_ID: str = "wnnu6xbaaobllm4by4ws7choii"
     TEST_TEST_ITEM_ID: str = "ati7vxbc5honwxn4edvj4b7hya"
@@ -189,19 +200,26 @@ class Item(BaseModel):
 
     @root_validator(pre=True)
     def process_fields_and_vault_id(cls, values):
-        fields = values.get('fields', [])
-        filtered_fields = []
-        for field in fields:
-            if isinstance(field, dict) and field.get('type') != 'CONCEALED':
-                filtered_fields.append(field)
-            elif isinstance(field, ItemField) and field.type != 'CONCEALED':
-                filtered_fields.append(field)
-        values['fields'] = filtered_fields
+        # CLI JSON always yields dicts here, so no isinstance dance - one
+        # comprehension to drop concealed fields before validation.
+        values['fields'] = [
+            field
+            for field in values.get('fields') or ()
+            if field.get('type') != 'CONCEALED'
+        ]
         return values
 
 
-@dataclass
+@dataclass(slots=True)
 class ItemField:
+    """Item field exposing a read-only, dict-like view over its attributes
+
+    A NamedTuple would be lighter still, but pydantic coerces the CLI's
+    field dicts into this type, which needs keyword construction. The
+    mapping-style accessors below avoid allocating intermediate dicts on
+    the common paths.
+    """
+
     id: Optional[str] = None
     type: Optional[str] = None
     purpose: Optional[str] = None
@@ -210,20 +228,28 @@ class ItemField:
     reference: Optional[str] = None
     password_details: Optional[Dict] = None
 
+    # Attribute names in declaration order, shared by the view methods
+    _FIELDS = (
+        'id', 'type', 'purpose', 'label', 'value', 'reference',
+        'password_details',
+    )
+
+    def __getitem__(self, key: str) -> Any:
+        return getattr(self, key)
+
+    def values(self):
+        """Iterate attribute values without building a dict"""
+        return (getattr(self, name) for name in self._FIELDS)
+
     def dict(self, exclude_none: bool = False) -> Dict[str, Any]:
         """Convert to dictionary, optionally excluding None values"""
-        d = {
-            'id': self.id,
-            'type': self.type,
-            'purpose': self.purpose,
-            'label': self.label,
-            'value': self.value,
-            'reference': self.reference,
-            'password_details': self.password_details
-        }
         if exclude_none:
-            return {k: v for k, v in d.items() if v is not None}
-        return d
+            return {
+                name: value
+                for name in self._FIELDS
+                if (value := getattr(self, name)) is not None
+            }
+        return {name: getattr(self, name) for name in self._FIELDS}
 
     def get(self, key: str, default: Any = None) -> Any:
         """Mimic dict.get() behavior for compatibility"""
@@ -248,6 +274,23 @@ class VaultDetails(BaseModel):
 
 from lib.op import OpClient
 class BaseHandler:
+    # (method_name, command_path, args, options) tuples collected once per
+    # subclass definition, so instantiation doesn't reflect over the MRO.
+    _commands: List[tuple] = []
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Scan only this class's own namespace at definition time - the
+        # parents' commands are already in their _commands lists.
+        cls._commands = [
+            *getattr(cls, "_commands", ()),
+            *(
+                (name, func._command_path, func._args, func._options)
+                for name, func in cls.__dict__.items()
+                if callable(func) and hasattr(func, "_command_path")
+            ),
+        ]
+
     def __init__(self):
         """
         Initializes the handler and registers its decorated command methods.
@@ -257,24 +300,20 @@ class BaseHandler:
 
     def register_commands(self):
         """
-        Registers all methods decorated with @command as commands in the Commands singleton.
+        Registers the commands collected at class-definition time in the
+        Commands singleton, binding each one to this instance.
         """
         commands_singleton = Commands()
-        for name, method in inspect.getmembers(self, predicate=inspect.ismethod):
-            if hasattr(method, '_command_path'):
-                path = method._command_path
-                arguments = method._args
-                options = method._options
-                # Create a CommandNode with arguments and options
-                current_node = commands_singleton.root
-                for cmd in path:
-                    cmd_lower = cmd.lower()
-                    if cmd_lower not in current_node.sub_commands:
-                        current_node.sub_commands[cmd_lower] = CommandNode(name=cmd)
-                    current_node = current_node.sub_commands[cmd_lower]
-                current_node.handler = method
-                current_node.arguments = arguments
-                current_node.options = options
+        for name, path, arguments, options in type(self)._commands:
+            current_node = commands_singleton.root
+            for cmd in path:
+                cmd_lower = cmd.lower()
+                if cmd_lower not in current_node.sub_commands:
+                    current_node.sub_commands[cmd_lower] = CommandNode(name=cmd)
+                current_node = current_node.sub_commands[cmd_lower]
+            current_node.handler = getattr(self, name)
+            current_node.arguments = arguments
+            current_node.options = options
 
 
 @dataclass
@@ -1,14 +1,232 @@
 import asyncio
+import itertools
 import json
 import logging
+import math
+import random
+import re
+import sys
 import time
-from typing import Any, Awaitable, Callable, Generic, List, Optional, TypeVar
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    TypeVar,
+)
 
 from optypes.op_types import UserDetails
 
 T = TypeVar("T")  # Input type
 R = TypeVar("R")  # Return type
 
+# Posted once by the feeder and re-posted by each worker as it exits, so a
+# single marker shuts down the whole pool.
+_QUEUE_END = object()
+
+
+class FatalError(Exception):
+    """Wraps an error no retry or sibling task can recover from
+
+    Task functions raise this (wrapping e.g. an authentication failure) to
+    tell the executor that every remaining task would fail the same way;
+    the executor then skips the rest of the batch instead of burning an
+    API call and rate-limit quota per doomed task.
+    """
+    pass
+
+
+def _is_rate_limit_error(exc: Exception) -> bool:
+    """Whether an exception looks like a 1Password rate-limit rejection"""
+    message = str(exc).lower()
+    return "rate limit" in message or "429" in message
+
+
+# Error shapes that indicate the service (or the path to it) is down,
+# as opposed to a legitimate per-task failure like a denied grant.
+_OUTAGE_ERROR_RE = re.compile(
+    r"rate limit|timed? ?out|connection|unreachable|network|"
+    r"service unavailable|\b429\b|\b5\d{2}\b",
+    re.IGNORECASE,
+)
+
+
+def _is_outage_error(exc: Exception) -> bool:
+    """Whether an exception looks like an outage rather than a task failure"""
+    if isinstance(exc, (asyncio.TimeoutError, ConnectionError)):
+        return True
+    return bool(_OUTAGE_ERROR_RE.search(str(exc)))
+
+
+class TokenBucket:
+    """Token-bucket rate limiter smoothing request starts to a target rate
+
+    Concurrency limits alone don't bound request *rate* - a pool of fast
+    workers can burst well past a fixed-window server quota while staying
+    under the concurrency cap. Each acquire spends one token; tokens refill
+    continuously at `rate` per second up to `capacity`, and callers sleep
+    just long enough for the next token when the bucket runs dry.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else math.ceil(rate)
+        self._tokens = float(self.capacity)
+        self._last = time.monotonic()
+
+    async def acquire(self) -> None:
+        while True:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._last) * self.rate
+            )
+            self._last = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+            await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class AdaptiveLimiter:
+    """AIMD concurrency limiter: creep up on success, halve on rate limits
+
+    The worker pool size is a hard ceiling, but the safe level underneath
+    it varies per tenant and per 1Password quota. Additive increase (+0.5
+    per success) with multiplicative decrease (halve on a rate-limit
+    error) converges on the highest level the server sustains without
+    hand-tuning max_concurrent_tasks.
+    """
+
+    def __init__(self, initial: int, min_limit: int = 1):
+        self.current = float(initial)
+        self.min_limit = min_limit
+        self.max_limit = initial
+        self._in_flight = 0
+        self._cond = asyncio.Condition()
+
+    @property
+    def limit(self) -> int:
+        return int(self.current)
+
+    async def acquire(self) -> None:
+        async with self._cond:
+            while self._in_flight >= self.limit:
+                await self._cond.wait()
+            self._in_flight += 1
+
+    async def release(self) -> None:
+        async with self._cond:
+            self._in_flight -= 1
+            self._cond.notify()
+
+    def on_success(self) -> None:
+        self.current = min(self.max_limit, self.current + 0.5)
+
+    def on_error(self) -> None:
+        self.current = max(float(self.min_limit), self.current * 0.5)
+
+
+class CircuitBreaker:
+    """Fast-fail gate that opens after repeated consecutive failures
+
+    During a provider outage every queued task would otherwise be launched,
+    hold a concurrency slot for a full timeout, and fail identically. After
+    failure_threshold consecutive failures the breaker opens and pending
+    work is skipped immediately; once reset_timeout has passed, a single
+    half-open probe is allowed through, closing the breaker on success or
+    re-opening it on failure.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._probe_in_flight = False
+
+    def allow(self) -> bool:
+        """Whether a task may run right now"""
+        if self._opened_at is None:
+            return True
+        if (
+            not self._probe_in_flight
+            and time.monotonic() - self._opened_at >= self.reset_timeout
+        ):
+            self._probe_in_flight = True
+            return True
+        return False
+
+    @property
+    def is_open(self) -> bool:
+        return self._opened_at is not None
+
+    def on_success(self) -> None:
+        if self._opened_at is not None:
+            logging.info("Circuit breaker closed after successful probe.")
+        self._failures = 0
+        self._opened_at = None
+        self._probe_in_flight = False
+
+    def on_failure(self) -> None:
+        self._failures += 1
+        self._probe_in_flight = False
+        if self._opened_at is not None:
+            # Failed probe: stay open for another full timeout
+            self._opened_at = time.monotonic()
+        elif self._failures >= self.failure_threshold:
+            self._opened_at = time.monotonic()
+            logging.warning(
+                "Circuit breaker opened after %d consecutive failures; "
+                "skipping pending tasks for %.0fs.",
+                self._failures,
+                self.reset_timeout,
+            )
+
+
+async def _run_one(limiter, bucket, breaker, task_func, task, args, kwargs):
+    """Run a single task under the given limiters, mapping failure to None
+
+    Module-level rather than a closure inside execute: each invocation's
+    coroutine frame binds only these six references instead of capturing
+    the executor's whole call scope in closure cells.
+    """
+    if not breaker.allow():
+        return None
+    await limiter.acquire()
+    if bucket is not None:
+        await bucket.acquire()
+    # The try covers only the awaited call: nothing else here can
+    # raise, and the narrower scope keeps the captured traceback short.
+    try:
+        result = await task_func(task, *args, **kwargs)
+    except FatalError:
+        # Unrecoverable for the whole batch - let the worker stop the pool
+        raise
+    except Exception as e:
+        if _is_rate_limit_error(e):
+            limiter.on_error()
+        # Only outage-shaped errors feed the breaker - a run of legitimate
+        # per-task failures (e.g. denied grants) must not trip it and get
+        # the rest of the batch silently skipped.
+        if _is_outage_error(e):
+            breaker.on_failure()
+        logging.error(f"Error processing task {task}: {e}")
+        # Once logged, the frame chain is dead weight - drop it rather
+        # than let it pin locals until the exception is collected.
+        e.__traceback__ = None
+        return None
+    else:
+        limiter.on_success()
+        breaker.on_success()
+        return result
+    finally:
+        await limiter.release()
+
 
 class AsyncExecutor(Generic[T, R]):
     """
@@ -16,25 +234,179 @@ class AsyncExecutor(Generic[T, R]):
     This class let's us control the concurrency to not overload 1Password (and get rate limited)
     While the client handler allows us to actually run the subcommands.
     """
-    def __init__(self, max_concurrent_tasks: Optional[int] = None):
+    def __init__(
+        self,
+        max_concurrent_tasks: Optional[int] = None,
+        rps: Optional[float] = None,
+        breaker: Optional[CircuitBreaker] = None,
+    ):
         """
         Initializes the AsyncExecutor.
 
         Args:
             max_concurrent_tasks (Optional[int]): Maximum number of concurrent tasks. Defaults to 5.
+            rps (Optional[float]): If set, task starts are additionally
+                smoothed to this many per second via a token bucket, so
+                short tasks can't burst past a server's fixed-window quota.
         """
         self.max_concurrent_tasks = max_concurrent_tasks or 5
-        self.semaphore = asyncio.Semaphore(self.max_concurrent_tasks)
+        # Effective concurrency floats between 1 and the pool size based on
+        # observed rate-limit errors; the pool size is only the ceiling.
+        self.limiter = AdaptiveLimiter(initial=self.max_concurrent_tasks)
+        self.bucket = TokenBucket(rate=rps) if rps else None
+        # Each executor gets its own breaker so one batch's trouble can't
+        # suppress unrelated callers; pass a shared instance to couple
+        # executors that should fast-fail together.
+        self.breaker = breaker if breaker is not None else CircuitBreaker()
+
+    async def _feed(self, entries: List[tuple], in_q: asyncio.Queue) -> None:
+        """Feed indexed inputs to the workers, then post the end marker"""
+        for entry in entries:
+            await in_q.put(entry)
+        await in_q.put(_QUEUE_END)
+
+    async def _worker(
+        self,
+        task_func,
+        args,
+        kwargs,
+        in_q: asyncio.Queue,
+        out_q: asyncio.Queue,
+        stop: asyncio.Event,
+    ) -> None:
+        """Pull inputs until the end marker, pushing (index, result) pairs
+
+        Once the stop event is set (a sibling hit a FatalError), remaining
+        inputs are drained to None results without touching the API.
+        """
+        while True:
+            entry = await in_q.get()
+            if entry is _QUEUE_END:
+                # Leave the marker in place for the sibling workers
+                in_q.put_nowait(_QUEUE_END)
+                return
+            index, task = entry
+            if stop.is_set():
+                out_q.put_nowait((index, None))
+                continue
+            try:
+                result = await _run_one(
+                    self.limiter, self.bucket, self.breaker, task_func, task, args, kwargs
+                )
+            except FatalError as e:
+                stop.set()
+                logging.error(f"Fatal error, skipping remaining tasks: {e}")
+                e.__traceback__ = None
+                result = None
+            out_q.put_nowait((index, result))
+
+    async def _execute_indexed(
+        self, tasks: List[T], task_func, args, kwargs, estimate_cost=None
+    ) -> AsyncIterator[tuple]:
+        """Run tasks through the worker pool, yielding (index, result) pairs
+
+        A fixed pool of workers pulls from a bounded input queue instead of
+        scheduling one semaphore-gated coroutine per task: only
+        O(concurrency) task frames exist at a time no matter how long the
+        input list is, and the bounded queue gives the feeder natural
+        backpressure.
+
+        With estimate_cost set, inputs are dispatched costliest-first (LPT
+        scheduling) so an expensive task isn't started last and left
+        straggling behind an otherwise-finished batch. The yielded indices
+        always refer to original input positions.
+        """
+        logging.info(
+            "Processing %d tasks with up to %d concurrent tasks.",
+            len(tasks),
+            self.max_concurrent_tasks,
+        )
+
+        entries = list(enumerate(tasks))
+        if estimate_cost is not None:
+            entries.sort(key=lambda entry: estimate_cost(entry[1]), reverse=True)
+
+        worker_count = min(self.max_concurrent_tasks, len(tasks)) or 1
+        in_q: asyncio.Queue = asyncio.Queue(maxsize=self.max_concurrent_tasks * 2)
+        out_q: asyncio.Queue = asyncio.Queue()
+        stop = asyncio.Event()
+
+        if sys.version_info >= (3, 11):
+            # TaskGroup skips gather's _GatheringFuture bookkeeping and
+            # cancels the whole pool as a unit if the consumer bails early.
+            async with asyncio.TaskGroup() as tg:
+                tg.create_task(self._feed(entries, in_q))
+                for _ in range(worker_count):
+                    tg.create_task(
+                        self._worker(task_func, args, kwargs, in_q, out_q, stop)
+                    )
+                for _ in range(len(tasks)):
+                    yield await out_q.get()
+        else:
+            feeder = asyncio.create_task(self._feed(entries, in_q))
+            workers = [
+                asyncio.create_task(
+                    self._worker(task_func, args, kwargs, in_q, out_q, stop)
+                )
+                for _ in range(worker_count)
+            ]
+
+            try:
+                for _ in range(len(tasks)):
+                    yield await out_q.get()
+                await feeder
+                await asyncio.gather(*workers)
+            finally:
+                feeder.cancel()
+                for worker in workers:
+                    worker.cancel()
+
+        logging.info("All tasks have been processed.")
+
+    async def execute_iter(
+        self,
+        tasks: List[T],
+        task_func: Callable[[T], Awaitable[R]],
+        *args,
+        estimate_cost: Optional[Callable[[T], float]] = None,
+        **kwargs,
+    ) -> AsyncIterator[Optional[R]]:
+        """
+        Executes tasks concurrently and yields each result as it completes.
+
+        Unlike execute, results stream out in completion order, so a caller
+        can start downstream work (and release per-task inputs) as soon as
+        the fastest task finishes instead of waiting out the slowest one in
+        the batch. Failed tasks yield None, matching execute.
+
+        Args:
+            tasks (List[T]): A list of task inputs.
+            task_func (Callable[[T], Awaitable[R]]): The asynchronous function to execute for each task.
+            *args: Additional positional arguments to pass to task_func.
+            **kwargs: Additional keyword arguments to pass to task_func.
+
+        Yields:
+            Optional[R]: Each task's result, in completion order.
+        """
+        async for _index, result in self._execute_indexed(
+            tasks, task_func, args, kwargs, estimate_cost=estimate_cost
+        ):
+            yield result
 
     async def execute(
         self,
         tasks: List[T],
         task_func: Callable[[T], Awaitable[R]],
         *args,
+        estimate_cost: Optional[Callable[[T], float]] = None,
         **kwargs,
     ) -> List[Optional[R]]:
         """
-        Executes tasks concurrently using asyncio with a semaphore to limit concurrency.
+        Executes tasks concurrently through a bounded worker pool.
+
+        Results come back in input order; callers that don't need the full
+        ordered list should prefer execute_iter and consume results as they
+        complete.
 
         Args:
             tasks (List[T]): A list of task inputs.
@@ -45,41 +417,169 @@ class AsyncExecutor(Generic[T, R]):
         Returns:
             List[Optional[R]]: A list of results from the executed tasks.
         """
-        logging.info(
-            f"Processing {len(tasks)} tasks with up to {self.max_concurrent_tasks} concurrent tasks."
-        )
+        results: List[Optional[R]] = [None] * len(tasks)
+        async for index, result in self._execute_indexed(
+            tasks, task_func, args, kwargs, estimate_cost=estimate_cost
+        ):
+            results[index] = result
+        return results
 
-        async def sem_task(task: T) -> Optional[R]:
-            async with self.semaphore:
-                try:
-                    result = await task_func(task, *args, **kwargs)
-                    return result
-                except Exception as e:
-                    logging.error(f"Error processing task {task}: {e}")
-                    return None
-
-        coroutines: List[Awaitable[Optional[R]]] = [
-            sem_task(task) for task in tasks
-        ]
-
-        results: List[Optional[R]] = await asyncio.gather(
-            *coroutines, return_exceptions=False
-        )
 
-        logging.info("All tasks have been processed.")
-        return results
+def iter_chunks(data: Iterable[Any], chunk_size: int) -> Iterator[List[Any]]:
+    """Yield successive chunks without materializing them all up front
+
+    Streaming consumers should prefer this over chunk_list - the source can
+    be any iterable and only one chunk is alive at a time, so downstream
+    work can start before chunking finishes.
+    """
+    iterator = iter(data)
+    while chunk := list(itertools.islice(iterator, chunk_size)):
+        yield chunk
 
 
 def chunk_list(data: List[Any], chunk_size: int) -> List[List[Any]]:
-    return [data[i: i + chunk_size] for i in range(0, len(data), chunk_size)]
+    """Eagerly chunked copy, for callers that need len() or slicing"""
+    return list(iter_chunks(data, chunk_size))
+
+
+class ChunkedView:
+    """Zero-copy, indexable view of a list in fixed-size chunks
+
+    Nothing is materialized up front: len() and indexing are computed from
+    the source list, and each chunk is sliced out only when accessed. For
+    retry-heavy flows that walk the same chunks repeatedly this makes
+    re-chunking free - iterate the same view again instead of rebuilding a
+    list of sublists per pass. The view reads through to the source, so it
+    always reflects the list's current contents.
+    """
+
+    __slots__ = ("_data", "_chunk_size")
+
+    def __init__(self, data: List[Any], chunk_size: int):
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+        self._data = data
+        self._chunk_size = chunk_size
+
+    def __len__(self) -> int:
+        return -(-len(self._data) // self._chunk_size)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("chunk index out of range")
+        start = index * self._chunk_size
+        return self._data[start:start + self._chunk_size]
+
+    def __iter__(self) -> Iterator[List[Any]]:
+        chunk_size = self._chunk_size
+        for start in range(0, len(self._data), chunk_size):
+            yield self._data[start:start + chunk_size]
+
+
+def chunked_view(data: List[Any], chunk_size: int) -> ChunkedView:
+    """A reusable lazy alternative to chunk_list for list inputs"""
+    return ChunkedView(data, chunk_size)
 
 
-async def handle_rate_limit_backoff(rate_limit_hit, backoff_attempts):
-    """Handles rate limit backoff with exponential delay."""
+class ChunkSizeTuner:
+    """
+    Keeps an exponential moving average of per-call latency for an operation
+    and derives a chunk size that holds each chunk's wall time near a target.
+    Replaces the hand-picked chunk-size constants, which behave very
+    differently locally vs against a rate-limited tenant.
+    """
+
+    def __init__(
+        self,
+        initial_size: int = 10,
+        target_seconds: float = 0.5,
+        min_size: int = 1,
+        max_size: int = 100,
+        smoothing: float = 0.3,
+    ):
+        self.size = initial_size
+        self.target_seconds = target_seconds
+        self.min_size = min_size
+        self.max_size = max_size
+        self.smoothing = smoothing
+        self._latency_ema: Optional[float] = None
+
+    def record(self, chunk_size: int, elapsed: float) -> None:
+        """Feed back the observed wall time for a processed chunk."""
+        if chunk_size <= 0 or elapsed <= 0:
+            return
+        per_call = elapsed / chunk_size
+        if self._latency_ema is None:
+            self._latency_ema = per_call
+        else:
+            self._latency_ema = (
+                self.smoothing * per_call
+                + (1 - self.smoothing) * self._latency_ema
+            )
+        tuned = round(self.target_seconds / self._latency_ema)
+        self.size = max(self.min_size, min(self.max_size, tuned))
+
+
+_chunk_tuners: dict = {}
+
+
+def _get_tuner(operation: str, initial_size: int = 10) -> ChunkSizeTuner:
+    tuner = _chunk_tuners.get(operation)
+    if tuner is None:
+        tuner = _chunk_tuners[operation] = ChunkSizeTuner(initial_size=initial_size)
+    return tuner
+
+
+def optimal_chunk_size(operation: str, initial_size: int = 10) -> int:
+    """Current tuned chunk size for an operation (e.g. 'item_get')."""
+    return _get_tuner(operation, initial_size).size
+
+
+def record_chunk_latency(operation: str, chunk_size: int, elapsed: float) -> None:
+    """Report a chunk's wall time so future chunk sizes adapt to it."""
+    _get_tuner(operation).record(chunk_size, elapsed)
+
+
+# The CLI's rate-limit message sometimes states its own cool-down, e.g.
+# "rate limit exceeded, try again in 30 seconds".
+_RETRY_AFTER_RE = re.compile(r"(?:try again|retry)\s+(?:in|after)\s+(\d+)", re.IGNORECASE)
+
+
+def parse_retry_after(message: str) -> Optional[float]:
+    """Extract a server-stated cool-down (seconds) from a CLI error message"""
+    match = _RETRY_AFTER_RE.search(message)
+    return float(match.group(1)) if match else None
+
+
+async def handle_rate_limit_backoff(
+    rate_limit_hit,
+    backoff_attempts,
+    base: float = 1.0,
+    cap: float = 60.0,
+    retry_after: Optional[float] = None,
+):
+    """Handles rate limit backoff, preferring the server's own cool-down.
+
+    When the CLI error states how long to wait (see parse_retry_after),
+    sleeping exactly that plus a little jitter neither re-429s early nor
+    idles past the quota reset. Without a stated cool-down, fall back to
+    full-jitter exponential delay: a uniform random time in
+    [0, min(cap, base * 2**attempts)], which keeps concurrent workers that
+    hit the same 429 from retrying in lockstep.
+    """
     if rate_limit_hit:
-        backoff_time = min(60, (2**backoff_attempts))
-        print(
-            f"Rate limit hit! Pausing for {backoff_time} seconds before retrying..."
+        if retry_after is not None:
+            backoff_time = retry_after + random.uniform(0, 0.5)
+        else:
+            backoff_time = random.uniform(
+                0, min(cap, base * (2**backoff_attempts))
+            )
+        logging.warning(
+            f"Rate limit hit! Pausing for {backoff_time:.1f} seconds before retrying..."
         )
         await asyncio.sleep(backoff_time)
         return backoff_attempts + 1, False, 0
@@ -97,22 +597,60 @@ def command(command_path: str, args: list, options: list):
     return decorator
 
 
+# stdin reader shared across async_input calls, keyed to the loop that
+# connected it so a new loop (e.g. successive run_async calls) reconnects.
+_stdin_reader: Optional[asyncio.StreamReader] = None
+_stdin_reader_loop = None
+
+
+async def _get_stdin_reader() -> asyncio.StreamReader:
+    global _stdin_reader, _stdin_reader_loop
+    loop = asyncio.get_running_loop()
+    if _stdin_reader is None or _stdin_reader_loop is not loop:
+        reader = asyncio.StreamReader()
+        protocol = asyncio.StreamReaderProtocol(reader)
+        await loop.connect_read_pipe(lambda: protocol, sys.stdin)
+        _stdin_reader = reader
+        _stdin_reader_loop = loop
+    return _stdin_reader
+
+
 async def async_input(prompt: str = "") -> str:
-    loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(None, lambda: input(prompt))
+    """Prompt for a line of input without blocking the event loop.
+
+    On POSIX, stdin is registered with the running loop and read directly,
+    so no thread-pool worker sits blocked in read() per prompt. Event loops
+    that can't watch pipes (Windows proactor) fall back to the executor.
+    """
+    loop = asyncio.get_running_loop()
+    try:
+        reader = await _get_stdin_reader()
+    except (NotImplementedError, OSError):
+        return await loop.run_in_executor(None, lambda: input(prompt))
+    if prompt:
+        print(prompt, end="", flush=True)
+    line = await reader.readline()
+    if not line:
+        raise EOFError
+    return line.decode().rstrip("\n")
+
+
+# Loop owned by run_async for call sites with no running loop. asyncio.run
+# builds and tears down a fresh loop per call; reusing one keeps repeated
+# prompt-loop invocations on the same loop (which also keeps the cached
+# stdin reader valid between them).
+_owned_loop: Optional[asyncio.AbstractEventLoop] = None
 
 
 def run_async(coro: Awaitable[Any]) -> Any:
     try:
-        loop = asyncio.get_running_loop()
+        # Already inside a loop: schedule the coroutine and return the task
+        asyncio.get_running_loop()
+        return asyncio.create_task(coro)
     except RuntimeError:
-        loop = None
+        pass
 
-    if loop and loop.is_running():
-        # If there's a running loop, schedule the coroutine and return the task
-        # make mypy ignore it idk
-        task = asyncio.create_task(coro)
-        return task
-    else:
-        # If no loop is running, create a new event loop and run the coroutine
-        return asyncio.run(coro)
+    global _owned_loop
+    if _owned_loop is None or _owned_loop.is_closed():
+        _owned_loop = asyncio.new_event_loop()
+    return _owned_loop.run_until_complete(coro)
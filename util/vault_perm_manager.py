@@ -1,65 +1,182 @@
 import logging
 import time
-from typing import Any, List, Optional
+from typing import Any, Dict, FrozenSet, List, Optional, Sequence, Tuple
 
+from lib.op import AuthenticationError
 from lib.vaults import VaultHandler
 from optypes.op_types import PermissionOperator, UserDetails, VaultOverview
 from lib.base_handler import BaseOpHandler
 
-from util.utils import AsyncExecutor
+from util.utils import AsyncExecutor, FatalError, record_chunk_latency
+
+# How long a fetched (vault, group) permission set stays trusted. Reconcile
+# runs revisit the same vaults within seconds; 1Password ACLs don't churn
+# underneath us in that window.
+_ACL_CACHE_TTL_SECONDS = 30.0
+
 
 class VaultPermissionsManager(BaseOpHandler):
-    def __init__(self, max_workers: int = 8):
-        super().__init__(resource_type="vault")
-        self.executor = AsyncExecutor(max_concurrent_tasks=max_workers)
+    def __init__(
+        self,
+        max_workers: int = 8,
+        client=None,
+        rps: Optional[float] = 15,
+    ):
+        # rps defaults near 1Password's documented write limit so bursts of
+        # short grant calls don't trip the fixed-window quota; pass None to
+        # leave the rate unbounded.
+        super().__init__(resource_type="vault", client=client)
+        self.executor = AsyncExecutor(max_concurrent_tasks=max_workers, rps=rps)
         self.logger = logging.getLogger(__name__)
-        self.vaults = VaultHandler()
+        self.vaults = VaultHandler(client=self.client)
+        # Bound once so the per-vault/per-chunk paths do a dict lookup
+        # instead of re-comparing the enum on every iteration; an unknown
+        # action now raises instead of silently doing nothing.
+        self._group_dispatch = {
+            PermissionOperator.GRANT: self.vaults.group.grant,
+            PermissionOperator.REVOKE: self.vaults.group.revoke,
+        }
+        self._user_dispatch = {
+            PermissionOperator.GRANT: self.vaults.user.grant,
+            PermissionOperator.REVOKE: self.vaults.user.revoke,
+        }
+        # (vault_id, group) -> (expiry, permission set) for skipping
+        # grants/revokes that are already in effect
+        self._acl_cache: Dict[Tuple[str, str], Tuple[float, FrozenSet[str]]] = {}
+
+    async def _group_permissions(
+        self, vault_id: str, group: str
+    ) -> Optional[FrozenSet[str]]:
+        """Current permissions a group holds on a vault, briefly cached
+
+        Returns None when the listing fails - callers treat that as
+        "unknown" and issue the update unconditionally rather than skip it
+        on stale information.
+        """
+        key = (vault_id, group)
+        cached = self._acl_cache.get(key)
+        now = time.monotonic()
+        if cached is not None and cached[0] > now:
+            return cached[1]
+        try:
+            entries = await self.vaults.group.list(vault_id)
+        except Exception as e:
+            self.logger.debug(f"Could not prefetch ACLs for vault {vault_id}: {e}")
+            return None
+        permissions: FrozenSet[str] = frozenset()
+        for entry in entries:
+            if group in (entry.get("name"), entry.get("id")):
+                permissions = frozenset(entry.get("permissions") or ())
+                break
+        self._acl_cache[key] = (now + _ACL_CACHE_TTL_SECONDS, permissions)
+        return permissions
 
     async def update_permissions_for_vaults(
         self,
-        vault_chunks: List[List[VaultOverview]],
+        vaults: List[VaultOverview],
         group: str,
         permission: str,
         action: PermissionOperator
     ) -> None:
-        """Update permissions for chunks of vaults"""
-        for chunk in vault_chunks:
-            self.logger.info(f"Starting {action.value} permissions for {len(chunk)} vaults.")
-            try:
-                for vault in chunk:
-                    if action == PermissionOperator.GRANT:
-                        await self.vaults.group.grant(
-                            vault_id=vault.id,
-                            permission=permission,
-                            group=group
-                        )
-                    else:
-                        await self.vaults.group.revoke(
-                            vault_id=vault.id,
-                            permission=permission,
-                            group=group
-                        )
-            except Exception as e:
-                self.logger.error(f"Error updating permissions for vault {vault.id}: {e}")
+        """Update group permissions for a flat list of vaults
+
+        The executor bounds concurrency, so callers no longer need to
+        pre-chunk the vault list - chunk boundaries just acted as sync
+        barriers that made fast vaults wait on slow ones.
+        """
+        # %-style args so the format work is skipped below INFO level
+        self.logger.info(
+            "Starting %s permissions for %d vaults.", action.value, len(vaults)
+        )
+        start_time = time.perf_counter()
+
+        await self.executor.execute(
+            tasks=vaults,
+            task_func=self._update_group_permission_for_vault,
+            group=group,
+            permission=permission,
+            action=action,
+        )
+
+        elapsed_time = time.perf_counter() - start_time
+        self.logger.info(
+            "Completed %s permissions for %d vaults in %.2f seconds.",
+            action.value,
+            len(vaults),
+            elapsed_time,
+        )
+
+    async def _update_group_permission_for_vault(
+        self,
+        vault: VaultOverview,
+        group: str,
+        permission: str,
+        action: PermissionOperator,
+    ) -> None:
+        """Apply one group grant/revoke to a single vault
+
+        In reconcile-style runs most requested updates are already in
+        effect, so the group's current permissions are checked first and
+        no-op calls are skipped entirely - usually the bulk of the batch.
+        """
+        fn = self._group_dispatch.get(action)
+        if fn is None:
+            raise KeyError(f"Unknown permission action: {action!r}")
+
+        wanted = set(permission.split(","))
+        existing = await self._group_permissions(vault.id, group)
+        if existing is not None:
+            if action == PermissionOperator.GRANT and wanted <= existing:
+                self.logger.debug(
+                    f"Vault {vault.id}: {group} already holds {permission}, skipping"
+                )
+                return
+            if action == PermissionOperator.REVOKE and wanted.isdisjoint(existing):
+                self.logger.debug(
+                    f"Vault {vault.id}: {group} doesn't hold {permission}, skipping"
+                )
+                return
+
+        # Only auth failures are caught here - every remaining vault would
+        # fail identically, so FatalError tells the executor to stop the
+        # batch. Anything else propagates to the executor's runner, which
+        # logs it, maps it to None without cancelling siblings, and feeds
+        # the adaptive limiter and circuit breaker.
+        try:
+            await fn(vault_id=vault.id, permission=permission, group=group)
+        except AuthenticationError as e:
+            raise FatalError("1Password authentication failed") from e
+        # The set we cached is now stale for this pair
+        self._acl_cache.pop((vault.id, group), None)
 
     async def update_permissions_for_user(
         self,
-        user_chunks: List[List[UserDetails]],
+        user_chunks: Sequence[List[UserDetails]],
         permissions: str,
         action: PermissionOperator,
         vault_id: str,
     ) -> None:
         self.logger.info(
-            f"Processing {len(user_chunks)} chunks of users to {action.value} permissions in vault {vault_id}"
+            "Processing %d chunks of users to %s permissions in vault %s",
+            len(user_chunks),
+            action.value,
+            vault_id,
         )
 
-        await self.executor.execute(
+        # Stream completions instead of gathering - each chunk's UserDetails
+        # become collectable as soon as that chunk finishes, rather than
+        # everything being pinned until the slowest chunk in the batch.
+        # Bigger chunks first (LPT) so a large user chunk never starts last
+        # and straggles behind the rest of the batch.
+        async for _ in self.executor.execute_iter(
             tasks=user_chunks,
             task_func=self.update_user_permission,
             action=action,
             vault_id=vault_id,
             permissions=permissions,
-        )
+            estimate_cost=len,
+        ):
+            pass
 
     async def update_group_permission(
         self,
@@ -68,25 +185,13 @@ class VaultPermissionsManager(BaseOpHandler):
         permission: str,
         action: PermissionOperator,
     ) -> None:
-        """Update group permissions for vaults"""
-        self.logger.info(f"Starting {action.value} permissions for {len(chunk)} vaults.")
-        start_time = time.perf_counter()
+        """Update group permissions for a chunk of vaults
 
-        for vault in chunk:
-            try:
-                if action == PermissionOperator.GRANT:
-                    await self.vaults.group.grant(vault.id, permission, group)
-                elif action == PermissionOperator.REVOKE:
-                    await self.vaults.group.revoke(vault.id, permission, group)
-            except Exception as e:
-                self.logger.error(
-                    f"Error updating permissions for vault {vault.id}: {e}"
-                )
-
-        elapsed_time = time.perf_counter() - start_time
-        self.logger.info(
-            f"Completed {action.value} permissions for {len(chunk)} vaults in {elapsed_time:.2f} seconds."
-        )
+        Kept as an alias: the executor already bounds concurrency, so a
+        pre-chunked list carries no scheduling meaning and both entry
+        points run through the same fan-out.
+        """
+        await self.update_permissions_for_vaults(chunk, group, permission, action)
 
     async def update_user_permission(
         self,
@@ -97,15 +202,27 @@ class VaultPermissionsManager(BaseOpHandler):
     ) -> None:
         """Update user permissions"""
         self.logger.info(
-            f"Running {action.value} for {len(chunk)} users in vault {vault_id} with permissions: {permissions}."
+            "Running %s for %d users in vault %s with permissions: %s.",
+            action.value,
+            len(chunk),
+            vault_id,
+            permissions,
         )
 
+        fn = self._user_dispatch.get(action)
+        if fn is None:
+            raise KeyError(f"Unknown permission action: {action!r}")
+        # Auth failures doom every remaining chunk the same way, so they
+        # abort the batch; other errors propagate to the executor's runner,
+        # which logs them, maps them to None, and feeds the adaptive
+        # limiter and circuit breaker.
+        start_time = time.perf_counter()
         try:
-            if action == PermissionOperator.GRANT:
-                await self.vaults.user.grant(chunk, vault_id, permissions)
-            elif action == PermissionOperator.REVOKE:
-                await self.vaults.user.revoke(chunk, vault_id, permissions)
-        except Exception as e:
-            self.logger.error(
-                f"Error updating permissions for user {chunk} in vault {vault_id}: {e}"
-            )
+            await fn(chunk, vault_id, permissions)
+        except AuthenticationError as e:
+            raise FatalError("1Password authentication failed") from e
+        # Feed the tuner that sizes these chunks (the "user_permissions"
+        # consumer in Actions), so chunk size tracks observed latency.
+        record_chunk_latency(
+            "user_permissions", len(chunk), time.perf_counter() - start_time
+        )